@@ -0,0 +1,1040 @@
+import functools
+import operator
+import sys
+import uuid
+from array import array
+from collections import namedtuple
+from datetime import date
+
+# Nombres de cuentas fijas, internados para que las búsquedas en los
+# diccionarios del Mayor comparen por identidad
+_CAJA = sys.intern("Caja")
+_INVENTARIO = sys.intern("Inventario")
+_RENTAS_ANTICIPADAS = sys.intern("Rentas Pagadas Anticipado")
+_IVA_ACRED = sys.intern("IVA Acreditable")
+_IVA_POR_ACRED = sys.intern("IVA por Acreditar")
+_ACREEDORES = sys.intern("Acreedores")
+_DOCS = sys.intern("Documentos por Pagar")
+_IVA_TRAS = sys.intern("IVA Trasladado")
+_VENTAS = sys.intern("Ventas")
+_COSTO = sys.intern("Costo de lo Vendido")
+_GASTOS = sys.intern("Gastos Generales")
+_ANTICIPO_CLIENTES = sys.intern("Anticipo de Clientes")
+
+# Prefijo de las cuentas de Depreciación Acumulada ("Dep. Acum. De ...")
+_DEP_ACUM_PREFIJO = "Dep. Acum."
+
+# Categorías de Activo No Circulante para las Actividades de Inversión
+# del Estado de Flujos (se buscan dentro del nombre del activo)
+_CATEGORIAS_INVERSION = ("Departamento", "Equipo de computo", "Software", "Muebles", "iluminacion")
+
+# Plantillas de renglón para los reportes (se formatean una vez por línea)
+_DIARIO_ROW = "{:<12}{:<30}{:>10,.2f}{:>10,.2f}".format
+_DIARIO_SEP_DOBLE = "=" * 60
+_DIARIO_SEP = "-" * 60
+_DIARIO_HEADER = f"{'Fecha':<12}{'Cuentas':<30}{'Debe':>10}{'Haber':>10}"
+_MAYOR_ROW = "{:<11} {:<3} {:<20} {:>10.2f} {:>10.2f}".format
+_MAYOR_TOTAL = "{:<15}{:<20}{:>10.2f} {:>10.2f}   SALDO: {:>.2f}".format
+_MAYOR_SEP = "-" * 66
+_MAYOR_HEADER = "Fecha       Cód  Descripción               Debe        Haber"
+_SEP_BALANCE = "=" * 100 + "\n"
+_BALANZA_HEADER = f"{'Cuenta':<30}{'Debe':>12}{'Haber':>12}{'Debe':>12}{'Haber':>12}"
+_BALANZA_SEP = "-" * len(_BALANZA_HEADER)
+_BALANZA_ROW = "{:<30}{:>12,.2f}{:>12,.2f}{:>12,.2f}{:>12,.2f}".format
+
+# Importe máximo por operación (10 billones de pesos, en centavos). Las
+# columnas del Mayor son enteros de 64 bits (hasta ~9.2e18); el límite deja
+# margen para el IVA y para los totales acumulados de cada cuenta.
+_MAX_CENTAVOS = 10 ** 15
+
+
+def a_centavos(pesos: float) -> int:
+    """Convierte un importe capturado en pesos a centavos enteros."""
+    return int(round(pesos * 100))
+
+
+def _porcentaje(centavos: int, num: int, den: int) -> int:
+    """
+    centavos * num / den redondeado al centavo más cercano, con las mitades
+    hacia afuera del cero: una pérdida da el mismo importe que la utilidad
+    equivalente, con signo contrario. Es la regla de todos los impuestos.
+    """
+    redondeado = (2 * abs(centavos) * num + den) // (2 * den)
+    return redondeado if centavos >= 0 else -redondeado
+
+
+def _como_centavos(monto) -> int:
+    """
+    Valida que un importe venga en centavos enteros y dentro de
+    _MAX_CENTAVOS. Se llama al inicio de cada operación, antes de modificar
+    el estado, para que un importe inválido no deje el Libro Diario y el
+    Mayor a medio registrar.
+    """
+    try:
+        centavos = operator.index(monto)
+    except TypeError:
+        raise TypeError(
+            f"Los importes se expresan en centavos enteros (use a_centavos); se recibió {monto!r}."
+        ) from None
+    if abs(centavos) > _MAX_CENTAVOS:
+        raise ValueError(
+            f"El importe excede el máximo permitido (${_MAX_CENTAVOS / 100:,.2f})."
+        )
+    return centavos
+
+
+# Fecha del día ya formateada: [ordinal del día, "dd/mm/aaaa"]
+_today_cache = [-1, ""]
+
+
+def _today_str() -> str:
+    """
+    Devuelve la fecha actual como "dd/mm/aaaa", llamando a strftime
+    sólo cuando cambia el día.
+    """
+    hoy = date.today()
+    dia = hoy.toordinal()
+    if _today_cache[0] != dia:
+        _today_cache[:] = [dia, hoy.strftime("%d/%m/%Y")]
+    return _today_cache[1]
+
+
+def _pesos(centavos: int) -> str:
+    """Importe en centavos como "$" seguido de los pesos alineados a 15 posiciones."""
+    return f"${centavos / 100:>15,.2f}"
+
+
+def _cache_por_version(metodo):
+    """
+    Memoriza el texto de un reporte en la instancia y lo reutiliza
+    mientras self._version no cambie.
+    """
+    nombre = metodo.__name__
+
+    @functools.wraps(metodo)
+    def envoltura(self):
+        guardado = self._reportes_cache.get(nombre)
+        if guardado is not None and guardado[0] == self._version:
+            return guardado[1]
+        texto = metodo(self)
+        self._reportes_cache[nombre] = (self._version, texto)
+        return texto
+    return envoltura
+
+
+def _requiere_apertura(metodo):
+    """Impide registrar operaciones antes del Asiento de Apertura."""
+    @functools.wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        if not self.apertura_realizada:
+            raise ValueError("Debe realizar primero el Asiento de Apertura.")
+        return metodo(self, *args, **kwargs)
+    return envoltura
+
+
+# ==========================
+# LÓGICA CONTABLE (Dominio)
+# ==========================
+# Asiento del Libro Diario
+Asiento = namedtuple("Asiento", "fecha descripcion lines code")
+
+
+class LedgerCol:
+    """
+    Movimientos de una cuenta del Mayor guardados por columnas:
+    los importes (debe/haber) en arreglos contiguos de enteros (centavos)
+    y los campos de texto en listas paralelas. La descripción completa
+    vive en el Asiento del Libro Diario; aquí sólo se guarda la versión
+    recortada que muestra el Mayor.
+    """
+    __slots__ = ("fecha", "desc_corta", "trans_code", "debe", "haber")
+
+    def __init__(self):
+        self.fecha = []
+        self.desc_corta = []  # descripción recortada para el reporte del Mayor
+        self.trans_code = []
+        self.debe = array("q")   # centavos
+        self.haber = array("q")
+
+    def agregar(self, fecha, desc_corta, trans_code, debe, haber):
+        # Primero los importes (los únicos que pueden fallar: no enteros o
+        # fuera de 64 bits); si haber falla se deshace debe, para que las
+        # columnas nunca queden con longitudes distintas
+        self.debe.append(debe)
+        try:
+            self.haber.append(haber)
+        except (TypeError, OverflowError):
+            self.debe.pop()
+            raise
+        self.fecha.append(fecha)
+        self.desc_corta.append(desc_corta)
+        self.trans_code.append(trans_code)
+
+
+class AperturaData:
+    """
+    Maneja la información contable y las operaciones:
+      1. Asiento de Apertura
+      2. Compras (Efectivo, Crédito, Combinada)
+      3. Pago de Rentas Pagadas por Anticipado
+      4. Compra de Papelería
+      5. Anticipo de Clientes
+      6. Venta
+      7. Costo de lo Vendido
+      8. Gastos Generales
+      9. Anulación de Anticipo de Clientes
+      10. Depreciaciones
+
+      + Libro Diario (registro automático de cada asiento)
+      + Tablas de Mayor (T-accounts)
+      + Balanza de Comprobación
+      + Balance General
+
+    Todos los importes se manejan en centavos (int) para que las sumas
+    de Debe y Haber cuadren exactamente; se convierten a pesos sólo al
+    formatear los reportes.
+    """
+    __slots__ = (
+        "company_name", "apertura_realizada", "_iva_num", "_iva_den",
+        "caja", "inventario", "rentas_anticipadas", "caja_inicial",
+        "activos_no_circulantes", "inversion_por_categoria",
+        "iva_acreditable", "iva_por_acreditar",
+        "acreedores", "documentos_por_pagar",
+        "anticipo_clientes", "anticipo_clientes_total",
+        "total_circulante", "total_no_circulante", "total_activo",
+        "total_pasivo", "capital",
+        "libro_diario", "ledger_accounts",
+        "_acct_id", "_acct_names", "_acct_cols", "_acct_debe", "_acct_haber",
+        "_cuentas_dep_acum", "_cuentas_clientes",
+        "_uid", "_version", "_reportes_cache",
+    )
+
+    def __init__(self):
+        # Nombre de la empresa
+        self.company_name = "Mi Empresa"
+        self.apertura_realizada = False
+        
+        # Tasa de IVA (16% = 4/25)
+        self._iva_num, self._iva_den = 4, 25
+        
+        # Cuentas de Activo (circulante)
+        self.caja = 0
+        self.inventario = 0
+        self.rentas_anticipadas = 0
+        self.caja_inicial = 0
+        
+        # Activo No Circulante
+        self.activos_no_circulantes = []
+        self.inversion_por_categoria = dict.fromkeys(_CATEGORIAS_INVERSION, 0)
+        
+        # Cuentas de IVA (activo circulante)
+        self.iva_acreditable = 0
+        self.iva_por_acreditar = 0
+        
+        # Pasivo
+        self.acreedores = 0
+        self.documentos_por_pagar = 0
+        self.anticipo_clientes = []  # Lista de (descripcion, monto)
+        self.anticipo_clientes_total = 0
+        
+        # Totales y Capital
+        self.total_circulante = 0
+        self.total_no_circulante = 0
+        self.total_activo = 0
+        self.total_pasivo = 0
+        self.capital = 0
+        
+        # Estructura para el Libro Diario (lista de asientos)
+        self.libro_diario = []  # Lista de Asiento
+        
+        # Diccionario para el Libro Mayor (cuenta -> LedgerCol). Internamente
+        # todo se resuelve por índice (_acct_id / _acct_cols); éste se
+        # conserva a propósito como acceso público por nombre a las mismas
+        # LedgerCol (y como indicador de "hay movimientos" para la interfaz)
+        self.ledger_accounts = {}
+        # Índice entero por cuenta (en orden de aparición) y, por índice,
+        # su LedgerCol y sus totales acumulados de Debe/Haber
+        self._acct_id = {}
+        self._acct_names = []
+        self._acct_cols = []
+        self._acct_debe = array("q")
+        self._acct_haber = array("q")
+        # Índices de las cuentas que el Estado de Flujos agrupa por categoría
+        # (se clasifican una sola vez, al dar de alta la cuenta)
+        self._cuentas_dep_acum = []
+        self._cuentas_clientes = []
+
+        # Identificador único de la instancia y versión del estado (se
+        # incrementa con cada cambio); juntos forman la llave de caché
+        # de los reportes. id() no sirve: se reutiliza al liberar objetos.
+        self._uid = uuid.uuid4().hex
+        self._version = 0
+        # nombre del reporte -> (versión, texto)
+        self._reportes_cache = {}
+
+    # ----------------------------------------------------------------
+    # MÉTODOS PARA EL LIBRO DIARIO
+    # ----------------------------------------------------------------
+    def registrar_en_libro_diario(self, descripcion, lineas, trans_code):
+        """
+        Agrega un asiento al libro diario y de inmediato lo 'postea' al libro mayor.
+        """
+        fecha_str = _today_str()
+        # Acepta cualquier iterable de (cuenta, debe, haber); se guarda como tupla
+        lineas = tuple(lineas)
+        self.libro_diario.append(Asiento(fecha_str, descripcion, lineas, trans_code))
+        self._version += 1
+        
+        # Postear cada línea de este asiento al libro mayor
+        self.post_to_ledger(fecha_str, descripcion, lineas, trans_code)
+
+    def post_to_ledger(self, fecha, descripcion, lineas, trans_code):
+        """
+        Registra cada movimiento (debe/haber) en la cuenta correspondiente
+        dentro de self.ledger_accounts.
+        """
+        # La descripción es la misma para todas las líneas del asiento
+        desc_corta = descripcion[:20]
+        for (cuenta, debe, haber) in lineas:
+            aid = self._acct_id.get(cuenta)
+            if aid is None:
+                aid = self._alta_cuenta(cuenta)
+            self._acct_cols[aid].agregar(fecha, desc_corta, trans_code, debe, haber)
+            self._acct_debe[aid] += debe
+            self._acct_haber[aid] += haber
+
+    def _alta_cuenta(self, cuenta: str) -> int:
+        """Da de alta una cuenta nueva en el Mayor y devuelve su índice."""
+        aid = len(self._acct_names)
+        col = LedgerCol()
+        self._acct_id[cuenta] = aid
+        self._acct_names.append(cuenta)
+        self._acct_cols.append(col)
+        self._acct_debe.append(0)
+        self._acct_haber.append(0)
+        self.ledger_accounts[cuenta] = col
+        if cuenta.startswith(_DEP_ACUM_PREFIJO):
+            self._cuentas_dep_acum.append(aid)
+        elif cuenta.startswith(_ANTICIPO_CLIENTES):
+            self._cuentas_clientes.append(aid)
+        return aid
+
+    def _totales_cuenta(self, cuenta: str):
+        """Devuelve (debe, haber) acumulados de una cuenta; (0, 0) si no existe."""
+        aid = self._acct_id.get(cuenta)
+        if aid is None:
+            return 0, 0
+        return self._acct_debe[aid], self._acct_haber[aid]
+
+    @_cache_por_version
+    def generar_libro_diario(self) -> str:
+        """
+        Genera un texto con columnas: Fecha | Cuentas | Debe | Haber
+        y al final la suma total de los débitos y créditos.
+        """
+        if not self.libro_diario:
+            return "Debes iniciar tu asiento de apertura para ver tu libro diario."
+
+        parts = []
+        parts.append(_DIARIO_SEP_DOBLE)
+        parts.append(f"{self.company_name.upper()} - LIBRO DIARIO (Modo Oscuro)")
+        parts.append(_DIARIO_SEP_DOBLE)
+        parts.append(_DIARIO_HEADER)
+        parts.append(_DIARIO_SEP)
+
+        for asiento in self.libro_diario:
+            # Encabezado del asiento
+            parts.append(f"{asiento.fecha:<12}{asiento.descripcion} (Código {asiento.code})")
+            
+            # Detalle de cada línea
+            for (cuenta, debe, haber) in asiento.lines:
+                parts.append(_DIARIO_ROW("", cuenta, debe / 100, haber / 100))
+            parts.append("")
+        
+        # Suma total Debe/Haber (cada línea ya está acumulada en su cuenta del Mayor)
+        total_debe = sum(self._acct_debe)
+        total_haber = sum(self._acct_haber)
+        parts.append(_DIARIO_SEP)
+        parts.append(_DIARIO_ROW("", "SUMA TOTAL", total_debe / 100, total_haber / 100))
+        parts.append("")
+
+        return "\n".join(parts)
+
+    # ----------------------------------------------------------------
+    # CÁLCULOS DE TOTALES
+    # ----------------------------------------------------------------
+    def recalcular_totales(self):
+        total_activo_circulante = (
+            self.caja 
+            + self.inventario 
+            + self.rentas_anticipadas 
+            + self.iva_acreditable 
+            + self.iva_por_acreditar
+        )
+        self.total_circulante = total_activo_circulante
+        # total_no_circulante y anticipo_clientes_total se mantienen al agregar renglones
+        self.total_activo = total_activo_circulante + self.total_no_circulante
+        self.total_pasivo = (self.acreedores + self.documentos_por_pagar
+                             + self.anticipo_clientes_total)
+
+    def actualizar_caja(self, monto: int):
+        """Fija el saldo inicial de Caja (antes del Asiento de Apertura)."""
+        self.caja = _como_centavos(monto)
+        self._version += 1
+
+    def agregar_activo_nc(self, nombre: str, valor: int):
+        """Agrega un activo no circulante y actualiza su total acumulado."""
+        valor = _como_centavos(valor)
+        self.activos_no_circulantes.append((nombre, valor))
+        self.total_no_circulante += valor
+        for categoria in _CATEGORIAS_INVERSION:
+            if categoria in nombre:
+                self.inversion_por_categoria[categoria] += valor
+        self._version += 1
+
+    def _agregar_anticipo(self, nombre: str, monto: int):
+        """Agrega un renglón al pasivo de anticipos y actualiza su total."""
+        self.anticipo_clientes.append((nombre, monto))
+        self.anticipo_clientes_total += monto
+
+    def calcular_asiento_apertura(self):
+        total_activo_circulante = self.caja
+        self.total_activo = total_activo_circulante + self.total_no_circulante
+        self.capital = self.total_activo
+        self.total_pasivo = 0
+        if not self.apertura_realizada:
+            # Efectivo al principio del periodo (primer Asiento de Apertura)
+            self.caja_inicial = self.caja
+        self.apertura_realizada = True
+        
+        # REGISTRAR EN LIBRO DIARIO (Código A)
+        lineas = []
+        if self.caja > 0:
+            lineas.append((_CAJA, self.caja, 0))
+        for (nombre, valor) in self.activos_no_circulantes:
+            lineas.append((nombre, valor, 0))
+        lineas.append(("Capital (Apertura)", 0, self.total_activo))
+        
+        self.registrar_en_libro_diario("Asiento de Apertura", lineas, "A")
+        
+        self.recalcular_totales()
+
+    def _iva(self, centavos: int) -> int:
+        """IVA de un importe en centavos, redondeado al centavo más cercano."""
+        return _porcentaje(centavos, self._iva_num, self._iva_den)
+
+    # ----------------------------------------------------------------
+    # OPERACIONES (1a PARTE)
+    # ----------------------------------------------------------------
+    @_requiere_apertura
+    def compra_en_efectivo(self, nombre: str, valor: int):
+        valor = _como_centavos(valor)
+        iva = self._iva(valor)
+        total = valor + iva
+        self.inventario += valor
+        self.iva_acreditable += iva
+        self.caja -= total
+        self.recalcular_totales()
+        
+        # Libro Diario (Código 1)
+        lineas = (
+            (_INVENTARIO, valor, 0),
+            (_IVA_ACRED, iva, 0),
+            (_CAJA, 0, total)
+        )
+        self.registrar_en_libro_diario(f"Compra en Efectivo - {nombre}", lineas, "1")
+
+    @_requiere_apertura
+    def compra_a_credito(self, nombre: str, valor: int):
+        valor = _como_centavos(valor)
+        nombre = sys.intern(nombre)
+        iva = self._iva(valor)
+        total = valor + iva
+        self.agregar_activo_nc(nombre, valor)
+        self.iva_por_acreditar += iva
+        self.acreedores += total
+        self.recalcular_totales()
+        
+        # Libro Diario (Código 2)
+        lineas = (
+            (nombre, valor, 0),
+            (_IVA_POR_ACRED, iva, 0),
+            (_ACREEDORES, 0, total)
+        )
+        self.registrar_en_libro_diario(f"Compra a Crédito - {nombre}", lineas, "2")
+
+    @_requiere_apertura
+    def compra_combinada(self, nombre: str, valor: int):
+        valor = _como_centavos(valor)
+        nombre = sys.intern(nombre)
+        iva_total = self._iva(valor)
+        # Mitad en efectivo y mitad a crédito; el centavo impar (si lo hay)
+        # va a la parte a crédito para que el asiento cuadre exacto
+        mitad_valor = valor // 2
+        mitad_iva = iva_total // 2
+        mitad = mitad_valor + mitad_iva
+        iva_credito = iva_total - mitad_iva
+        resto = (valor - mitad_valor) + iva_credito
+        self.agregar_activo_nc(nombre, valor)
+        
+        # Efectivo
+        self.caja -= mitad
+        self.iva_acreditable += mitad_iva
+        # Crédito
+        self.documentos_por_pagar += resto
+        self.iva_por_acreditar += iva_credito
+        self.recalcular_totales()
+        
+        # Libro Diario (Código 3)
+        lineas = (
+            (nombre, valor, 0),
+            (_IVA_ACRED, mitad_iva, 0),
+            (_IVA_POR_ACRED, iva_credito, 0),
+            (_CAJA, 0, mitad),
+            (_DOCS, 0, resto)
+        )
+        self.registrar_en_libro_diario(f"Compra Combinada - {nombre}", lineas, "3")
+
+    @_requiere_apertura
+    def pago_rentas_op(self, nombre: str, valor: int):
+        valor = _como_centavos(valor)
+        iva_renta = self._iva(valor)
+        total = valor + iva_renta
+        self.rentas_anticipadas += valor
+        self.iva_acreditable += iva_renta
+        self.caja -= total
+        self.recalcular_totales()
+        
+        # Libro Diario (Código 4)
+        lineas = (
+            (_RENTAS_ANTICIPADAS, valor, 0),
+            (_IVA_ACRED, iva_renta, 0),
+            (_CAJA, 0, total)
+        )
+        self.registrar_en_libro_diario(f"Pago Rentas - {nombre}", lineas, "4")
+
+    @_requiere_apertura
+    def compra_papeleria_op(self, nombre: str, valor: int):
+        valor = _como_centavos(valor)
+        cuenta = sys.intern(f"Papelería - {nombre}")
+        iva = self._iva(valor)
+        total = valor + iva
+        self.agregar_activo_nc(cuenta, valor)
+        self.iva_acreditable += iva
+        self.caja -= total
+        self.recalcular_totales()
+        
+        # Libro Diario (Código 5)
+        lineas = (
+            (cuenta, valor, 0),
+            (_IVA_ACRED, iva, 0),
+            (_CAJA, 0, total)
+        )
+        self.registrar_en_libro_diario(f"Compra Papelería - {nombre}", lineas, "5")
+        
+    @_requiere_apertura
+    def anticipo_clientes_op(self, nombre: str, venta: int):
+        """
+        Registra un anticipo de un cliente por la mitad del valor 'venta'.
+        """
+        venta = _como_centavos(venta)
+        cuenta_anticipo = sys.intern(f"Anticipo de Clientes - {nombre}")
+        cuenta_iva = sys.intern(f"IVA Trasladado - {nombre}")
+        half_sale = venta // 2
+        half_iva = self._iva(half_sale)
+        cobro = half_sale + half_iva
+        self.caja += cobro
+        # Guardamos dos renglones en la lista anticipo_clientes, uno para el anticipo y otro para el IVA
+        self._agregar_anticipo(cuenta_anticipo, half_sale)
+        self._agregar_anticipo(cuenta_iva, half_iva)
+        self.recalcular_totales()
+        
+        # Libro Diario (Código 6)
+        lineas = (
+            (_CAJA, cobro, 0),
+            (cuenta_anticipo, 0, half_sale),
+            (cuenta_iva, 0, half_iva),
+        )
+        self.registrar_en_libro_diario(f"Anticipo de Clientes - {nombre}", lineas, "6")
+
+    # ----------------------------------------------------------------
+    # OPERACIONES (2a PARTE) 
+    #   - Venta
+    #   - Costo de lo Vendido
+    #   - Gastos Generales
+    #   - Anular Anticipo de Cliente
+    #   - Depreciaciones
+    # ----------------------------------------------------------------
+    @_requiere_apertura
+    def registrar_venta(self, descripcion: str, monto: int):
+        """
+        Registra una venta (cobro completo en efectivo, por ejemplo).
+        Se incrementa la caja y se reconoce 'Ventas' y 'IVA Trasladado'.
+        """
+        monto = _como_centavos(monto)
+        iva_venta = self._iva(monto)
+        total = monto + iva_venta
+        self.caja += total
+        self.recalcular_totales()
+        
+        lineas = (
+            (_CAJA, total, 0),
+            (_VENTAS, 0, monto),
+            (_IVA_TRAS, 0, iva_venta)
+        )
+        self.registrar_en_libro_diario(f"Venta - {descripcion}", lineas, "V")
+
+    @_requiere_apertura
+    def registrar_costo_vendido(self, descripcion: str, costo: int):
+        """
+        Descarga el inventario y reconoce el Costo de lo Vendido.
+        """
+        costo = _como_centavos(costo)
+        if costo > self.inventario:
+            raise ValueError("No hay suficiente inventario para ese costo.")
+        
+        self.inventario -= costo
+        self.recalcular_totales()
+        
+        lineas = (
+            (_COSTO, costo, 0),
+            (_INVENTARIO, 0, costo)
+        )
+        self.registrar_en_libro_diario(f"Costo de lo Vendido - {descripcion}", lineas, "CV")
+
+    @_requiere_apertura
+    def registrar_gastos_generales(self, descripcion: str, monto: int):
+        """
+        Registra gastos generales (por ejemplo, pago de renta, servicios, etc.)
+        sin anticipo. Se descuenta de caja.
+        """
+        monto = _como_centavos(monto)
+        # Si hay IVA en el gasto, puedes dividir. Aquí lo hacemos sin IVA para simplificar.
+        self.caja -= monto
+        self.recalcular_totales()
+        
+        lineas = (
+            (_GASTOS, monto, 0),
+            (_CAJA, 0, monto)
+        )
+        self.registrar_en_libro_diario(f"Gastos Generales - {descripcion}", lineas, "G")
+
+    @_requiere_apertura
+    def anular_anticipo_cliente(self, descripcion: str, monto: int):
+        """
+        Cuando recibes la otra parte de la venta (o quieres 'liberar' ese anticipo),
+        lo conviertes en 'Ventas' y quitas el 'Anticipo de Clientes'.
+        """
+        monto = _como_centavos(monto)
+        # Suponiendo que el anticipo fue la mitad, ahora registramos la otra mitad
+        iva_venta = self._iva(monto)
+        total = monto + iva_venta
+        self.caja += total
+        self.recalcular_totales()
+
+        # Debitar Anticipo, acreditar Ventas e IVA Trasladado
+        lineas = (
+            (_CAJA, total, 0),
+            (_ANTICIPO_CLIENTES, monto, 0),     # Quitamos el anticipo
+            (_IVA_TRAS, 0, iva_venta),
+            (_VENTAS, 0, monto)
+        )
+        self.registrar_en_libro_diario(f"Anular anticipo - {descripcion}", lineas, "AA")
+    
+    @_requiere_apertura
+    def registrar_depreciacion(self, descripcion: str, dict_depreciaciones: dict):
+        """
+        dict_depreciaciones: un diccionario con las cuentas de Dep. Acum. y sus montos.
+        Por ejemplo:
+        {
+          "Dep. Acum. De Departamento": 100000,   # centavos
+          "Dep. Acum. De Eq. Y Tecnologia": 200000,
+          ...
+        }
+        Se registra la depreciación como un gasto (p.e. 'Gastos Generales' o 'Depreciación')
+        y se abona a las cuentas de Dep. Acumulada correspondientes.
+        """
+        dict_depreciaciones = {cuenta: _como_centavos(valor)
+                               for cuenta, valor in dict_depreciaciones.items()}
+        total_dep = sum(dict_depreciaciones.values())
+        # Cargo a Gastos Generales (o podrías usar otra cuenta "Gasto x Depreciación")
+        lineas = [(_GASTOS, total_dep, 0)]
+        
+        # Abono a cada Dep. Acumulada
+        for cuenta_dep, valor in dict_depreciaciones.items():
+            lineas.append((cuenta_dep, 0, valor))
+        
+        self.registrar_en_libro_diario(f"Depreciaciones - {descripcion}", lineas, "DEP")
+        self.recalcular_totales()
+
+    # --------------------------------------
+    # MÉTODO PARA GENERAR EL BALANCE
+    # --------------------------------------
+    @_cache_por_version
+    def generar_tabla_balance(self) -> str:
+        parts = []
+        append = parts.append
+        append(f"{'ACTIVO':<45}{'PASIVO':<35}{'CAPITAL':<20}\n")
+        append(_SEP_BALANCE)
+        
+        # Activo Circulante
+        append("Activo Circulante:\n")
+        append(f"  Caja: ${self.caja / 100:,.2f}\n")
+        if self.inventario:
+            append(f"  Inventario: ${self.inventario / 100:,.2f}\n")
+        if self.iva_acreditable:
+            append(f"  IVA Acreditable: ${self.iva_acreditable / 100:,.2f}\n")
+        if self.iva_por_acreditar:
+            append(f"  IVA por Acreditar: ${self.iva_por_acreditar / 100:,.2f}\n")
+        if self.rentas_anticipadas:
+            append(f"  Rentas Pagadas Anticipado: ${self.rentas_anticipadas / 100:,.2f}\n")
+        append(f"  Total Activo Circulante: ${self.total_circulante / 100:,.2f}\n")
+        
+        # Activo No Circulante
+        append("\nActivo No Circulante:\n")
+        if self.activos_no_circulantes:
+            for nombre, valor in self.activos_no_circulantes:
+                append(f"  {nombre}: ${valor / 100:,.2f}\n")
+        else:
+            append("  (Sin activos no circulantes)\n")
+        append(f"  Total Activo No Circulante: ${self.total_no_circulante / 100:,.2f}\n")
+        
+        # Pasivo
+        append("\nPASIVO:\n")
+        append(f"  Acreedores: ${self.acreedores / 100:,.2f}\n")
+        append(f"  Documentos por Pagar: ${self.documentos_por_pagar / 100:,.2f}\n")
+        if self.anticipo_clientes:
+            for nombre, monto in self.anticipo_clientes:
+                append(f"  {nombre}: ${monto / 100:,.2f}\n")
+        append("\n")
+        
+        # Totales y Capital
+        append(_SEP_BALANCE)
+        append(f"Total Activo: ${self.total_activo / 100:,.2f}\n")
+        append(f"Total Pasivo: ${self.total_pasivo / 100:,.2f}\n")
+        append(f"Capital: ${self.capital / 100:,.2f}\n")
+        append(f"Total Pasivo + Capital: ${(self.total_pasivo + self.capital) / 100:,.2f}\n")
+        
+        return "".join(parts)
+
+    @_cache_por_version
+    def generar_tabla_mayor(self) -> str:
+        """
+        Genera el reporte de cada cuenta en formato de 'T' (o tabla),
+        mostrando fecha, código del asiento, descripción, Debe, Haber
+        y el saldo final de cada cuenta.
+        """
+        if not self.ledger_accounts:
+            return "No hay movimientos en las cuentas del Mayor. (Realiza primero el Asiento de Apertura)"
+        
+        parts = []
+        for aid, (cuenta, col) in enumerate(zip(self._acct_names, self._acct_cols)):
+            parts.append("")
+            parts.append(f"CUENTA: {cuenta}")
+            parts.append(_MAYOR_HEADER)
+            parts.append(_MAYOR_SEP)
+            for (fecha, desc, code, debe, haber) in zip(
+                    col.fecha, col.desc_corta, col.trans_code, col.debe, col.haber):
+                parts.append(_MAYOR_ROW(fecha, code, desc, debe / 100, haber / 100))
+            total_debe = self._acct_debe[aid]
+            total_haber = self._acct_haber[aid]
+            saldo = total_debe - total_haber
+            parts.append(_MAYOR_SEP)
+            parts.append(_MAYOR_TOTAL("", "TOTAL", total_debe / 100, total_haber / 100, saldo / 100))
+            parts.append("")
+        parts.append("")
+        return "\n".join(parts)
+
+    # =======================
+    # BALANZA DE COMPROBACIÓN
+    # =======================
+    @_cache_por_version
+    def generar_balanza_comprobacion(self) -> str:
+        """
+        Genera la Balanza de Comprobación con cuatro columnas:
+        - Debe total
+        - Haber total
+        - Debe (diferencia)
+        - Haber (diferencia)
+        para cada cuenta. 
+        """
+        if not self.ledger_accounts:
+            return "No hay movimientos en las cuentas del Mayor. (Realiza primero el Asiento de Apertura)"
+
+        lines = []
+        lines.append("BALANZA DE COMPROBACIÓN".center(60))
+        lines.append("")
+        lines.append(_BALANZA_HEADER)
+        lines.append(_BALANZA_SEP)
+
+        # Totales de Debe/Haber (enteros: la suma es exacta)
+        sum_debe1 = sum(self._acct_debe)
+        sum_haber1 = sum(self._acct_haber)
+        sum_debe2 = 0
+        sum_haber2 = 0
+
+        # Recorremos cada cuenta con sus totales ya acumulados
+        for cuenta, total_debe, total_haber in zip(self._acct_names, self._acct_debe, self._acct_haber):
+            
+            # Cálculo de la diferencia (saldo deudor o acreedor)
+            diff = total_debe - total_haber
+            diff_debe = max(0, diff)
+            diff_haber = max(0, -diff)
+            
+            sum_debe2 += diff_debe
+            sum_haber2 += diff_haber
+
+            lines.append(_BALANZA_ROW(cuenta, total_debe / 100, total_haber / 100,
+                                      diff_debe / 100, diff_haber / 100))
+
+        lines.append(_BALANZA_SEP)
+        lines.append(_BALANZA_ROW("Totales", sum_debe1 / 100, sum_haber1 / 100,
+                                  sum_debe2 / 100, sum_haber2 / 100))
+
+        return "\n".join(lines)
+
+    # ===============================
+    # Balance General
+    # ===============================
+    @_cache_por_version
+    def generar_balance_general(self) -> str:
+        """
+        Suma Ventas, Costo de lo Vendido y Gastos Generales
+        para calcular la Utilidad del periodo.
+        """
+        if not self.ledger_accounts:
+            return "No hay datos para generar Balance General."
+
+        total_ventas, total_costo, total_gastos = self._cuentas_resultados()
+        utilidad_bruta = total_ventas - total_costo
+        utilidad_neta = utilidad_bruta - total_gastos
+
+        lineas = [
+            "Balance General",
+            f"Ventas: ${total_ventas / 100:,.2f}",
+            f"Costo de lo Vendido: ${total_costo / 100:,.2f}",
+            f"Utilidad Bruta: ${utilidad_bruta / 100:,.2f}",
+            f"Gastos Generales: ${total_gastos / 100:,.2f}",
+            f"Utilidad del Periodo: ${utilidad_neta / 100:,.2f}",
+            "",
+        ]
+        return "\n".join(lineas)
+
+    def _cuentas_resultados(self):
+        """
+        Devuelve (ventas, costo de lo vendido, gastos generales) a partir
+        de los totales ya acumulados de cada cuenta de resultados.
+        """
+        # 'Ventas' (en el Haber)
+        total_ventas = self._totales_cuenta(_VENTAS)[1]
+        # 'Costo de lo Vendido' (en el Debe)
+        total_costo = self._totales_cuenta(_COSTO)[0]
+        # 'Gastos Generales' (en el Debe)
+        total_gastos = self._totales_cuenta(_GASTOS)[0]
+        return total_ventas, total_costo, total_gastos
+
+    def calcular_utilidad(self) -> int:
+        """Utilidad del periodo: Ventas - Costo de lo Vendido - Gastos Generales."""
+        total_ventas, total_costo, total_gastos = self._cuentas_resultados()
+        return total_ventas - total_costo - total_gastos
+
+    # ===============================
+    # TABLAS (DataFrames para st.dataframe)
+    # ===============================
+    def balance_df(self) -> "pd.DataFrame":
+        """
+        Balance en forma de tabla: una fila por renglón con su sección.
+        """
+        import pandas as pd  # sólo se necesita para la interfaz
+
+        filas = [("Activo Circulante", "Caja", self.caja)]
+        for cuenta, valor in ((_INVENTARIO, self.inventario),
+                              (_IVA_ACRED, self.iva_acreditable),
+                              (_IVA_POR_ACRED, self.iva_por_acreditar),
+                              (_RENTAS_ANTICIPADAS, self.rentas_anticipadas)):
+            if valor:
+                filas.append(("Activo Circulante", cuenta, valor))
+        filas.append(("Activo Circulante", "Total Activo Circulante", self.total_circulante))
+        for nombre, valor in self.activos_no_circulantes:
+            filas.append(("Activo No Circulante", nombre, valor))
+        filas.append(("Activo No Circulante", "Total Activo No Circulante", self.total_no_circulante))
+        filas.append(("Pasivo", _ACREEDORES, self.acreedores))
+        filas.append(("Pasivo", _DOCS, self.documentos_por_pagar))
+        for nombre, monto in self.anticipo_clientes:
+            filas.append(("Pasivo", nombre, monto))
+        filas.append(("Totales", "Total Activo", self.total_activo))
+        filas.append(("Totales", "Total Pasivo", self.total_pasivo))
+        filas.append(("Totales", "Capital", self.capital))
+        filas.append(("Totales", "Total Pasivo + Capital", self.total_pasivo + self.capital))
+        return pd.DataFrame([(seccion, cuenta, importe / 100) for seccion, cuenta, importe in filas],
+                            columns=["Sección", "Cuenta", "Importe"])
+
+    def libro_diario_df(self) -> "pd.DataFrame":
+        """
+        Libro Diario en forma de tabla: una fila por cada línea de cada asiento
+        y, al final, la SUMA TOTAL de Debe y Haber (deben coincidir).
+        """
+        import pandas as pd
+
+        filas = [
+            (asiento.fecha, asiento.code, asiento.descripcion, cuenta, debe / 100, haber / 100)
+            for asiento in self.libro_diario
+            for (cuenta, debe, haber) in asiento.lines
+        ]
+        filas.append(("", "", "", "SUMA TOTAL",
+                      sum(self._acct_debe) / 100, sum(self._acct_haber) / 100))
+        return pd.DataFrame(
+            filas, columns=["Fecha", "Código", "Descripción", "Cuenta", "Debe", "Haber"])
+
+    def balanza_comprobacion_df(self) -> "pd.DataFrame":
+        """
+        Balanza de Comprobación en forma de tabla, con la fila de Totales al final.
+        """
+        import pandas as pd
+
+        cuentas = list(self._acct_names)
+        debe = self._acct_debe.tolist()
+        haber = self._acct_haber.tolist()
+        saldo_deudor = [max(0, d - h) for d, h in zip(debe, haber)]
+        saldo_acreedor = [max(0, h - d) for d, h in zip(debe, haber)]
+        columnas = {
+            "Debe": debe + [sum(debe)],
+            "Haber": haber + [sum(haber)],
+            "Saldo Deudor": saldo_deudor + [sum(saldo_deudor)],
+            "Saldo Acreedor": saldo_acreedor + [sum(saldo_acreedor)],
+        }
+        df = {"Cuenta": cuentas + ["Totales"]}
+        df.update((nombre, [v / 100 for v in valores]) for nombre, valores in columnas.items())
+        return pd.DataFrame(df)
+
+    def _saldo_deudor(self, cuenta: str) -> int:
+        """Debe menos Haber acumulados de una cuenta (0 si no tiene movimientos)."""
+        debe, haber = self._totales_cuenta(cuenta)
+        return debe - haber
+
+    # ==========================================
+    # ESTADO DE CAMBIOS EN EL CAPITAL CONTABLE
+    # ==========================================
+    @_cache_por_version
+    def generar_estado_flujos_efectivo(self) -> str:
+        # Calcular valores necesarios
+        utilidad_ejercicio = self.calcular_utilidad()
+        depreciacion_total = sum(self._acct_haber[aid] for aid in self._cuentas_dep_acum)
+        
+        # Calcular cambios en cuentas de operación
+        cambio_clientes = sum(self._acct_debe[aid] - self._acct_haber[aid]
+                              for aid in self._cuentas_clientes)
+        
+        cambio_inventario = self._saldo_deudor(_INVENTARIO)
+        
+        cambio_iva_acreditable = self._saldo_deudor(_IVA_ACRED)
+        
+        cambio_iva_por_acreditar = self._saldo_deudor(_IVA_POR_ACRED)
+        
+        cambio_proveedores = -self._saldo_deudor(_ACREEDORES)
+        
+        iva_trasladado = self._totales_cuenta(_IVA_TRAS)[1]
+        iva_por_trasladar = self._totales_cuenta("IVA por Trasladar")[1]
+        inversion_total = self.total_no_circulante
+        
+        # Calculos de impuestos
+        isr = _porcentaje(utilidad_ejercicio, 30, 100)
+        ptu = _porcentaje(utilidad_ejercicio, 10, 100)
+        utilidad_despues_impuestos = utilidad_ejercicio - isr - ptu
+        
+        # Efectivo inicial/final
+        caja_inicial = self.caja_inicial
+        caja_final = self.caja
+        
+        # Subtotales de operación
+        suma_cambios_operacion = (cambio_clientes + cambio_inventario
+                                  + cambio_iva_acreditable + cambio_iva_por_acreditar)
+        flujo_operacion = utilidad_ejercicio + depreciacion_total + cambio_proveedores - isr - ptu
+        efectivo_generado = utilidad_ejercicio + isr + ptu + cambio_proveedores + depreciacion_total
+        suma_aplicacion = (self.inventario + cambio_clientes
+                           + self.iva_acreditable + self.iva_por_acreditar)
+        
+        # Actividades de inversión y financiamiento
+        inversion = self.inversion_por_categoria
+        inv_departamento = inversion["Departamento"]
+        inv_equipo_computo = inversion["Equipo de computo"]
+        inv_software = inversion["Software"]
+        inv_muebles = inversion["Muebles"]
+        inv_iluminacion = inversion["iluminacion"]
+        flujo_financiamiento = -self.capital - self.acreedores
+        disminucion_caja = caja_inicial - caja_final
+        
+        lineas = [
+            "",
+            "ESTADOS DE FLUJOS DE EFECTIVO",
+            "METODO INDIRECTO",
+            "    Actividades en Operación",
+            "",
+            f"Sumar   Clientes             {_pesos(cambio_clientes)}",
+            f"Sumar   Almacén              {_pesos(cambio_inventario)}",
+            f"Sumar   IVA Acreditado       {_pesos(cambio_iva_acreditable)}",
+            f"Sumar   IVA por acreditar    {_pesos(cambio_iva_por_acreditar)}    {_pesos(suma_cambios_operacion)}",
+            f"Restar  IVA Trasladado       {_pesos(iva_trasladado)}",
+            f"Restar  IVA por trasladar    {_pesos(iva_por_trasladar)}",
+            f"Restar  Proveedores          {_pesos(cambio_proveedores)}",
+            f"Restar  Provisiones de ISR   {_pesos(isr)}    30%    {_pesos(isr)}    {_pesos(utilidad_despues_impuestos)}",
+            f"Restar  Provision de PTU     {_pesos(ptu)}    10%    {_pesos(ptu)}",
+            f"Restar  Utilidad ejercicio   {_pesos(utilidad_ejercicio)}",
+            "",
+            f"    Flujos netos del efectivo de actividades en operación    {_pesos(flujo_operacion)}",
+            "",
+            "",
+            "    Actividades de Inversion",
+            "",
+            f"    Departamento               {_pesos(inv_departamento)}",
+            f"    Equipo de computo y tecnologias {_pesos(inv_equipo_computo)}",
+            f"    Software                   {_pesos(inv_software)}",
+            f"    Muebles y Enseres          {_pesos(inv_muebles)}",
+            f"    Equipo de iluminacion      {_pesos(inv_iluminacion)}",
+            "",
+            f"    Flujos netos del efectivo de inversion    {_pesos(inversion_total)}",
+            "",
+            f"    Capital social             {_pesos(-self.capital)}",
+            f"    Acreedores diversos        {_pesos(-self.acreedores)}",
+            "",
+            f"    Flujos netos de efectivo de actividades de financiamiento    {_pesos(flujo_financiamiento)}",
+            "",
+            "    Incremento Neto de efectivo y equivalentes de efectivo",
+            "",
+            "    Efectivo al Final del periodo",
+            f"    Caja               {_pesos(caja_final)}",
+            "    Efectivo al Principio del periodo",
+            f"    Caja               {_pesos(caja_inicial)}",
+            "",
+            "    Efectivo al Principio del periodo",
+            "    Bancos",
+            f"    Efectivo al Final del periodo       {_pesos(disminucion_caja)}    {_pesos(0)}    {_pesos(disminucion_caja)}",
+            "    Bancos",
+            f"    Efectivo al final del periodo               {_pesos(-disminucion_caja)}",
+            "",
+            "",
+            "METODO DIRECTO",
+            f"Utlidad del ejercicio               {_pesos(utilidad_ejercicio)}",
+            "Cargos a resultados que no implican utilizacion de efectivo",
+            f"ISR                 {_pesos(isr)}",
+            f"PTU                 {_pesos(ptu)}",
+            f"Acreedores          {_pesos(cambio_proveedores)}    {_pesos(isr + ptu + cambio_proveedores)}",
+            f"Depreciaciones      {_pesos(depreciacion_total)}",
+            f"Efectivo generado en la operación       {_pesos(efectivo_generado)}",
+            f"Financiamiento y otras fuentes       {_pesos(0)}",
+            f"Proveedores                 {_pesos(0)}",
+            f"Suma de las fuentes de efectivo       {_pesos(efectivo_generado)}",
+            "    APLICACIÓN DE EFECTIVO",
+            f"Almacén                 {_pesos(self.inventario)}",
+            f"Clientes                {_pesos(cambio_clientes)}",
+            f"IVA acreditable         {_pesos(self.iva_acreditable)}",
+            f"IVA por acreditar       {_pesos(self.iva_por_acreditar)}",
+            f"IVA trasladado          {_pesos(iva_trasladado)}",
+            f"IVA por trasladar       {_pesos(iva_por_trasladar)}    {_pesos(suma_aplicacion)}",
+            f"Activos no circulantes      {_pesos(inversion_total)}",
+            f"Disminucion neta del efectivo      {_pesos(disminucion_caja)}",
+            f"Saldo inicial de caja       {_pesos(caja_inicial)}",
+            "Saldo final de caja",
+            "",
+        ]
+        return "\n".join(lineas)